@@ -0,0 +1,45 @@
+# health_interceptor.py - answers health probes before FastAPI's middleware stack
+from typing import Iterable
+
+import orjson
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+_METHOD_NOT_ALLOWED = orjson.dumps({"detail": "Method Not Allowed"})
+_METHOD_NOT_ALLOWED_HEADERS = _JSON_HEADERS + [
+    (b"allow", b"GET, HEAD"),
+    (b"content-length", str(len(_METHOD_NOT_ALLOWED)).encode()),
+]
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI wrapper around the FastAPI app.
+    GET (and HEAD, for uptime probes) on a health path is served directly from
+    `payload`, encoded once at startup. Every other request (and the
+    lifespan/websocket scopes) goes to the wrapped app.
+    """
+
+    def __init__(self, app, payload: dict, paths: Iterable[str] = ("/health",)):
+        self.app = app
+        self.paths = frozenset(paths)
+        self._body = orjson.dumps(payload)
+        self._headers = _JSON_HEADERS + [(b"content-length", str(len(self._body)).encode())]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method == "GET" or method == "HEAD":
+            status = 200
+            headers = self._headers
+            # HEAD keeps GET's headers (content-length included) but sends no body
+            body = self._body if method == "GET" else b""
+        else:
+            status = 405
+            headers = _METHOD_NOT_ALLOWED_HEADERS
+            body = _METHOD_NOT_ALLOWED
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -1,22 +1,43 @@
 # enhanced_main.py - OPTIMIZED FOR MINIMAL LATENCY
 # enhanced_main.py - OPTIMIZED FOR MINIMAL LATENCY
-import base64
+import os
+
+# Parallelism comes from the frame executor - keep each native library to one thread so
+# MAX_WORKERS frames don't each fan out into a full-size TF/OpenMP pool. Must run before
+# tensorflow is imported (TF reads these itself); explicit values in the environment still win.
+# The batcher's TFLite interpreter is sized separately, see INFERENCE_THREADS.
+for _var in ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS", "TF_NUM_INTEROP_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import pybase64
 import cv2
 import numpy as np
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import mediapipe as mp
 import asyncio
-import json
+import atexit
+import orjson
 import logging
-import os
+import logging.handlers
 import tensorflow as tf
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 import threading
 from queue import Queue, Empty
 import socket
+from dataclasses import dataclass
+
+from health_interceptor import HealthCheckInterceptor
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # PyTurboJPEG needs the native libjpeg-turbo library - fall back to OpenCV without it
+    turbo_jpeg = None
 
 
 def find_free_port(start_port=8000, max_tries=50):
@@ -35,9 +56,32 @@ def find_free_port(start_port=8000, max_tries=50):
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
+# Worker threads only enqueue records; one listener thread does the actual console I/O
+_log_queue = Queue(-1)
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flushes whatever is still queued before the interpreter exits
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ASL Translation Server - Optimized")
+# Per-frame logs (confident predictions, slow frames) only with ASL_DEBUG=1;
+# otherwise slow frames are just counted and summarized periodically
+ASL_DEBUG = os.getenv("ASL_DEBUG") == "1"
+SLOW_REPORT_INTERVAL_S = 10.0
+_SLOW_COUNTS = {"inference_batches": 0, "landmark_frames": 0}
+# Frame workers, the batcher and the event loop all bump counters - += on a dict isn't atomic
+_COUNTER_LOCK = threading.Lock()
+
+def count_event(counters: dict, key: str):
+    with _COUNTER_LOCK:
+        counters[key] += 1
+
+def snapshot_counts(counters: dict) -> dict:
+    with _COUNTER_LOCK:
+        return dict(counters)
+
+app = FastAPI(title="ASL Translation Server - Optimized", default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -48,134 +92,240 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def env_int(name: str, default: int) -> int:
+    """Integer setting from the environment - a malformed value falls back instead of crashing startup"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"⚠️ Ignoring non-integer {name}={value!r}, using {default}")
+        return default
+
 # PERFORMANCE OPTIMIZATIONS
 MAX_WORKERS = 4  # Thread pool size for parallel processing
-PROCESSING_QUEUE_SIZE = 10  # Limit queue to prevent memory buildup
-TARGET_IMAGE_SIZE = (480, 640)  # Smaller size for faster processing
+# Every forward pass runs on the single batcher thread, so its interpreter gets the cores
+INFERENCE_THREADS = max(1, env_int("ASL_INFERENCE_THREADS", MAX_WORKERS))
+MAX_BATCH_SIZE = MAX_WORKERS  # At most one pending frame per worker thread
+FRAME_TIMEOUT_S = 2.0  # Give up on a frame that takes longer than this to process
+MAX_FRAME_SIDE = 480  # Long side cap - MediaPipe downsamples internally, landmarks are normalized
 JPEG_QUALITY = 70  # Balance between quality and speed
+FEATURE_REPEAT_EPS_SQ = 1e-4  # Squared L2 distance below which landmarks count as unchanged
 
-# Initialize MediaPipe Hands with OPTIMIZED settings for speed
-mp_hands = mp.solutions.hands.Hands(
-    static_image_mode=False,
-    max_num_hands=1,
-    min_detection_confidence=0.6,  # Slightly lower for faster detection
-    min_tracking_confidence=0.4,   # Lower for smoother tracking
-    model_complexity=0  # Use LITE model for speed (0=fastest, 1=balanced, 2=accurate)
-)
+def create_hands_detector():
+    """MediaPipe Hands with OPTIMIZED settings for speed - not thread-safe, one per worker"""
+    return mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        min_detection_confidence=0.6,  # Slightly lower for faster detection
+        min_tracking_confidence=0.4,   # Lower for smoother tracking
+        model_complexity=0  # Use LITE model for speed (0=fastest, 1=balanced, 2=accurate)
+    )
 
 mp_drawing = mp.solutions.drawing_utils
 
 # ASL Labels
 LABELS = ["Yes", "No", "I Love You", "Hello", "Thank You"]
 
+UNKNOWN_CLASS = -1
+
+# Landmark indices of each fingertip and the joint below it (thumb, index, middle, ring, pinky)
+_FINGER_TIP_IDX = np.array([4, 8, 12, 16, 20])
+_FINGER_PIP_IDX = np.array([3, 6, 10, 14, 18])
+# Bit per finger, thumb = bit 0 ... pinky = bit 4
+_FINGER_BIT_WEIGHTS = np.array([1, 2, 4, 8, 16], dtype=np.uint8)
+
+# Raised-finger bitmask -> (LABELS index, confidence)
+_RULE_GESTURES = {
+    0b11111: (3, 0.85),  # Hello
+    0b10010: (2, 0.8),   # I Love You - index + pinky
+    0b00001: (0, 0.75),  # Yes - just thumb
+    0b00110: (1, 0.75),  # No - index + middle
+    0b00000: (4, 0.7),   # Thank You
+}
+# Every 5-bit mask has a slot, so classification is a plain index with no hashing or branches
+_RULE_LOOKUP = tuple(_RULE_GESTURES.get(code, (UNKNOWN_CLASS, 0.3)) for code in range(32))
+
+def _rule_classify(landmarks: np.ndarray) -> tuple[int, float]:
+    """Finger-geometry classifier over (21, 3) landmarks - returns a LABELS index and confidence"""
+    # A fingertip above its lower joint counts as raised - one vectorized comparison
+    fingers_up = landmarks[_FINGER_TIP_IDX, 1] < landmarks[_FINGER_PIP_IDX, 1]
+    code = int(fingers_up.view(np.uint8).dot(_FINGER_BIT_WEIGHTS))
+    return _RULE_LOOKUP[code]
+
 # Thread pool for parallel processing
 executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 
+class TFLitePredictor:
+    """TFLite backend - one interpreter whose tensors are reused across calls.
+    Handles both float-IO models and full-integer (int8 in/out) models."""
+    
+    def __init__(self, tflite_path: str, max_batch_size: int = MAX_BATCH_SIZE):
+        # The default op resolver applies the XNNPACK delegate (float and int8 kernels). Only the
+        # batcher thread invokes it, so it is multi-threaded rather than pinned like the frame workers
+        self.interpreter = tf.lite.Interpreter(model_path=tflite_path, num_threads=INFERENCE_THREADS)
+        # Sized once for the largest batch - smaller batches are padded instead of
+        # paying resize_tensor_input + allocate_tensors whenever the batch size moves
+        self.interpreter.resize_tensor_input(self.interpreter.get_input_details()[0]["index"],
+                                             [max_batch_size, 63])
+        self.interpreter.allocate_tensors()
+        self._max_batch_size = max_batch_size
+        self._padded = np.zeros((max_batch_size, 63), dtype=np.float32)
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self._input_index = input_details["index"]
+        self._output_index = output_details["index"]
+        self.input_dtype = input_details["dtype"]
+        self._int8_input = self.input_dtype == np.int8
+        self._input_scale, self._input_zero_point = input_details["quantization"]
+        self._int8_output = output_details["dtype"] == np.int8
+        self._output_scale, self._output_zero_point = output_details["quantization"]
+        if self._int8_input:
+            self.quantization_mode = "full-integer int8"
+        elif any(t["dtype"] == np.int8 for t in self.interpreter.get_tensor_details()):
+            self.quantization_mode = "dynamic-range (float IO, int8 weights)"
+        else:
+            self.quantization_mode = "float"
+    
+    def _quantize(self, features: np.ndarray) -> np.ndarray:
+        scaled = np.round(features / self._input_scale + self._input_zero_point)
+        return np.clip(scaled, -128, 127).astype(np.int8)
+    
+    def predict_batch(self, features: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """(class_ids, confidences) for the first `count` rows of `features`.
+        A full (max_batch_size, 63) buffer (the batcher's) is fed as-is; anything else is padded."""
+        if features.shape[0] != self._max_batch_size:
+            self._padded[:count] = features[:count]
+            features = self._padded
+        if self._int8_input:
+            model_input = self._quantize(features)
+        else:
+            model_input = np.ascontiguousarray(features, dtype=np.float32)
+        self.interpreter.set_tensor(self._input_index, model_input)
+        self.interpreter.invoke()
+        predictions = self.interpreter.get_tensor(self._output_index)
+        # One argmax pass, then gather the winning scores (quantization is monotonic,
+        # so int8 outputs are ranked as-is and only the winners are dequantized)
+        predicted_classes = predictions[:count].argmax(axis=1)
+        confidences = predictions[np.arange(count), predicted_classes]
+        if self._int8_output:
+            confidences = (confidences.astype(np.float32) - self._output_zero_point) * self._output_scale
+        return predicted_classes, confidences
+
+class SavedModelPredictor:
+    """SavedModel backend - the serving signature wrapped in one graph traced for any (N, 63) batch"""
+    
+    def __init__(self, signature):
+        input_key = next(iter(signature.structured_input_signature[1]))
+        output_key = next(iter(signature.structured_outputs))
+        
+        @tf.function(input_signature=[tf.TensorSpec([None, 63], tf.float32)])
+        def infer(features):
+            # Top-1 is fused into the graph so only (class_id, confidence) leave TF
+            probabilities = signature(**{input_key: features})[output_key]
+            top = tf.math.top_k(probabilities, k=1)
+            return top.indices[:, 0], top.values[:, 0]
+        
+        self._infer = infer
+    
+    def predict_batch(self, features: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """(class_ids, confidences) for the first `count` rows of `features`"""
+        predicted_classes, confidences = self._infer(tf.constant(features[:count], dtype=tf.float32))
+        return predicted_classes.numpy(), confidences.numpy()
+
 class OptimizedASLModel:
     def __init__(self):
         self.model = None
+        self.predictor = None
         self.model_loaded = False
-        self.inference_lock = threading.RLock()
-        self.load_model()
+        # No inference lock: once loaded, the InferenceBatcher thread is the only caller
+        # of predict_batch_fast, so the interpreter is never entered concurrently.
+        # No per-thread interpreters either - the workers' frames are coalesced into one
+        # batched invoke on an INFERENCE_THREADS-wide interpreter instead.
+        # load_model() runs in the background once the server starts (see startup hook)
     
-    def load_model(self):
-        """Load TensorFlow model with optimizations"""
+    def load_model(self, models_dir: Optional[str] = None):
+        """Load the fastest available model: TFLite (int8 or dynamic-range) first, then the TF SavedModel"""
+        # Resolved once here so the inference loop never touches the global list
+        self._active_labels = tuple(LABELS)
+        self._n_labels = len(self._active_labels)
+        self.model_loaded = False
+        self.predictor = None
         try:
-            model_path = os.path.join(os.path.dirname(__file__), 'models', 'asl_model_tf')
-            if os.path.exists(model_path):
+            if models_dir is None:
+                models_dir = os.path.join(os.path.dirname(__file__), 'models')
+            tflite_path = os.path.join(models_dir, 'asl_model.tflite')
+            model_path = os.path.join(models_dir, 'asl_model_tf')
+            # One directory read instead of a stat per candidate artifact
+            try:
+                with os.scandir(models_dir) as entries:
+                    available = {entry.name for entry in entries}
+            except FileNotFoundError:
+                available = set()
+            
+            if 'asl_model.tflite' in available:
+                # A corrupt or incompatible .tflite must not hide a usable SavedModel next to it
+                try:
+                    self.predictor = TFLitePredictor(tflite_path)
+                    # Warm up the interpreter
+                    _ = self.predictor.predict_batch(np.zeros((1, 63), dtype=np.float32), 1)
+                    self.model_loaded = True
+                    logger.info(f"✅ TFLite model loaded and warmed up - {self.predictor.quantization_mode}, "
+                                f"input {np.dtype(self.predictor.input_dtype).name}")
+                except Exception as e:
+                    logger.error(f"❌ Failed to load TFLite model, trying the SavedModel: {e}")
+                    self.predictor = None
+            
+            if not self.model_loaded and 'asl_model_tf' in available:
                 self.model = tf.saved_model.load(model_path)
                 logger.info("✅ TensorFlow SavedModel loaded")
-                # Warm up the model
-                dummy_input = tf.constant(np.zeros((1, 63), dtype=np.float32))
-                infer = self.model.signatures.get("serving_default")
-                if infer:
-                    _ = infer(dummy_input)
+                signature = self.model.signatures.get("serving_default")
+                if signature:
+                    self.predictor = SavedModelPredictor(signature)
+                    # Warm up the model
+                    _ = self.predictor.predict_batch(np.zeros((1, 63), dtype=np.float32), 1)
                     self.model_loaded = True
                     logger.info("✅ Model warmed up")
                 else:
                     logger.warning("⚠️ No serving_default signature found, using rule-based fallback")
-                    self.model_loaded = False
-            else:
-                logger.warning("⚠️ Model not found, using optimized rule-based classification")
-                self.model_loaded = False
+            
+            if not self.model_loaded and 'asl_model_tf' not in available:
+                logger.warning("⚠️ No usable model found, using optimized rule-based classification")
         except Exception as e:
             logger.error(f"❌ Failed to load model: {e}")
+            self.predictor = None
             self.model_loaded = False
     
-    def predict_fast(self, features: np.ndarray) -> tuple[str, float]:
-        """Ultra-fast prediction with thread safety"""
-        with self.inference_lock:
-            if self.model_loaded and self.model is not None:
-                try:
-                    start_time = time.perf_counter()
-                    features_reshaped = tf.constant(features.reshape(1, -1), dtype=tf.float32)
-                    if hasattr(self.model, "signatures"):
-                        # SavedModel inference
-                        infer = self.model.signatures["serving_default"]
-                        predictions = infer(features_reshaped)
-                        # Adjust based on actual output tensor name (inspect signatures if needed)
-                        output_key = list(predictions.keys())[0]
-                        predictions = predictions[output_key].numpy()
-                    else:
-                        # Fallback to Keras model inference (if applicable)
-                        predictions = self.model.predict(features_reshaped, verbose=0)
-                    confidence = float(np.max(predictions))
-                    predicted_class = int(np.argmax(predictions))
-                    gesture = LABELS[predicted_class] if predicted_class < len(LABELS) else "Unknown"
-                    inference_time = (time.perf_counter() - start_time) * 1000
-                    if inference_time > 50:
-                        logger.warning(f"⚠️ Slow inference: {inference_time:.1f}ms")
-                    return gesture, confidence
-                except Exception as e:
-                    logger.error(f"Model prediction error: {e}")
-                    return self.rule_based_prediction_fast(features)
-            else:
-                return self.rule_based_prediction_fast(features)
+    def predict_batch_fast(self, features: np.ndarray, count: int) -> List[tuple[str, float]]:
+        """Single forward pass over the first `count` rows of `features` - InferenceBatcher thread only (not thread-safe)"""
+        if not self.model_loaded:
+            return [self.rule_based_prediction_fast(row) for row in features[:count]]
+        try:
+            start_time = time.perf_counter()
+            predicted_classes, confidences = self.predictor.predict_batch(features, count)
+            labels = self._active_labels
+            n_labels = self._n_labels
+            results = []
+            for predicted_class, confidence in zip(predicted_classes.tolist(), confidences.tolist()):
+                gesture = labels[predicted_class] if predicted_class < n_labels else "Unknown"
+                results.append((gesture, confidence))
+            inference_time = (time.perf_counter() - start_time) * 1000
+            if inference_time > 50:
+                count_event(_SLOW_COUNTS, "inference_batches")
+                if ASL_DEBUG:
+                    logger.warning(f"⚠️ Slow inference: {inference_time:.1f}ms (batch of {count})")
+            return results
+        except Exception as e:
+            logger.error(f"Model prediction error: {e}")
+            return [self.rule_based_prediction_fast(row) for row in features[:count]]
     
     def rule_based_prediction_fast(self, features: np.ndarray) -> tuple[str, float]:
         """Ultra-fast rule-based gesture recognition"""
         try:
-            # Convert flattened features back to landmarks (optimized)
-            landmarks = features.reshape(21, 3)
-            
-            # Extract key points (pre-calculated indices for speed)
-            wrist_y = landmarks[0, 1]
-            thumb_tip_y = landmarks[4, 1]
-            thumb_ip_y = landmarks[3, 1]
-            index_tip_y = landmarks[8, 1]
-            index_pip_y = landmarks[6, 1]
-            middle_tip_y = landmarks[12, 1]
-            middle_pip_y = landmarks[10, 1]
-            ring_tip_y = landmarks[16, 1]
-            ring_pip_y = landmarks[14, 1]
-            pinky_tip_y = landmarks[20, 1]
-            pinky_pip_y = landmarks[18, 1]
-            
-            # Fast finger detection (vectorized operations)
-            fingers_up = [
-                thumb_tip_y < thumb_ip_y,  # Thumb
-                index_tip_y < index_pip_y,  # Index
-                middle_tip_y < middle_pip_y,  # Middle
-                ring_tip_y < ring_pip_y,  # Ring
-                pinky_tip_y < pinky_pip_y   # Pinky
-            ]
-            
-            fingers_up_count = sum(fingers_up)
-            
-            # Optimized gesture classification
-            if fingers_up_count == 5:
-                return "Hello", 0.85
-            elif fingers_up_count == 2 and fingers_up[1] and fingers_up[4]:  # Index + Pinky
-                return "I Love You", 0.8
-            elif fingers_up_count == 1 and fingers_up[0]:  # Just thumb
-                return "Yes", 0.75
-            elif fingers_up_count == 2 and fingers_up[1] and fingers_up[2]:  # Index + Middle
-                return "No", 0.75
-            elif fingers_up_count == 0:
-                return "Thank You", 0.7
-            else:
-                return "Unknown", 0.3
-                
+            class_id, confidence = _rule_classify(features.reshape(21, 3))
+            gesture = LABELS[class_id] if class_id != UNKNOWN_CLASS else "Unknown"
+            return gesture, confidence
         except Exception as e:
             logger.error(f"Rule-based prediction error: {e}")
             return "Unknown", 0.1
@@ -183,29 +333,127 @@ class OptimizedASLModel:
 # Initialize optimized model
 asl_model = OptimizedASLModel()
 
-def resize_image_fast(image: np.ndarray) -> np.ndarray:
-    """Fast image resizing for consistent processing"""
+class InferenceBatcher:
+    """Coalesces concurrent predictions from worker threads into one forward pass"""
+    def __init__(self, model: OptimizedASLModel, max_batch_size: int = MAX_BATCH_SIZE):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.pending: Queue = Queue()
+        # Allocated once; each batch is written into it in place and the whole buffer goes to the
+        # model. Rows past the batch are padding: zeros at first, afterwards stale features from
+        # earlier batches - always finite, and their outputs are discarded by slicing to `count`
+        self._batch_buffer = np.zeros((max_batch_size, 63), dtype=np.float32)
+        self.worker = threading.Thread(target=self._run, name="asl-inference-batcher", daemon=True)
+        self.worker.start()
+    
+    def predict(self, features: np.ndarray) -> tuple[str, float]:
+        """Queue a single feature vector and block until its batch has been scored"""
+        if not self.model.model_loaded:
+            # Rule-based fallback is cheaper than a queue round-trip
+            return self.model.rule_based_prediction_fast(features)
+        future = Future()
+        self.pending.put((features, future))
+        return future.result()
+    
+    def _run(self):
+        while True:
+            batch = [self.pending.get()]
+            # Drain whatever queued up while the previous batch was running -
+            # no fixed time window, so an idle server adds zero latency
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except Empty:
+                    break
+            
+            batch_features = self._batch_buffer
+            for row, (features, _) in enumerate(batch):
+                batch_features[row] = features
+            
+            try:
+                results = self.model.predict_batch_fast(batch_features, len(batch))
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            except Exception as e:
+                logger.error(f"Batched inference error: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+inference_batcher = InferenceBatcher(asl_model)
+
+class FrameArena:
+    """Per-worker scratch arrays and MediaPipe state for the data every frame needs"""
+    def __init__(self):
+        # Only valid until the same worker processes its next frame
+        self.features = np.empty(63, dtype=np.float32)
+        self.hands = create_hands_detector()
+        # Last scored landmarks on this worker - a still hand doesn't need re-scoring
+        self.last_features = np.full(63, np.inf, dtype=np.float32)
+        self.feature_diff = np.empty(63, dtype=np.float32)
+        self.last_prediction: Optional[tuple] = None
+        # Resize target reused across frames - reallocated only when the frame size changes
+        self.resized: Optional[np.ndarray] = None
+    
+    def resize_buffer(self, shape: tuple) -> np.ndarray:
+        if self.resized is None or self.resized.shape != shape:
+            self.resized = np.empty(shape, dtype=np.uint8)
+        return self.resized
+
+_worker_state = threading.local()
+
+def get_frame_arena() -> FrameArena:
+    """Return the calling worker thread's arena, creating it on first use"""
+    arena = getattr(_worker_state, "arena", None)
+    if arena is None:
+        arena = _worker_state.arena = FrameArena()
+    return arena
+
+def predict_unless_unchanged(arena: FrameArena, features: np.ndarray) -> tuple[str, float]:
+    """Reuse the worker's last prediction when the landmarks have barely moved"""
+    diff = np.subtract(features, arena.last_features, out=arena.feature_diff)
+    cached = arena.last_prediction
+    # Squared L2 (no sqrt); a model finishing its load must not keep serving rule-based results
+    if cached is not None and cached[0] == asl_model.model_loaded and np.dot(diff, diff) < FEATURE_REPEAT_EPS_SQ:
+        return cached[1]
+    prediction = inference_batcher.predict(features)
+    np.copyto(arena.last_features, features)
+    arena.last_prediction = (asl_model.model_loaded, prediction)
+    return prediction
+
+def resize_image_fast(image: np.ndarray, arena: FrameArena) -> np.ndarray:
+    """Fast image resizing for consistent processing - keeps the aspect ratio"""
     height, width = image.shape[:2]
+    long_side = max(height, width)
     
-    # Only resize if image is significantly larger
-    if width > TARGET_IMAGE_SIZE[1] or height > TARGET_IMAGE_SIZE[0]:
-        return cv2.resize(image, TARGET_IMAGE_SIZE, interpolation=cv2.INTER_LINEAR)
+    # Only resize if image is larger than MediaPipe needs
+    if long_side > MAX_FRAME_SIDE:
+        scale = MAX_FRAME_SIDE / long_side
+        new_width, new_height = int(width * scale), int(height * scale)
+        dst = arena.resize_buffer((new_height, new_width) + image.shape[2:])
+        return cv2.resize(image, (new_width, new_height), dst=dst, interpolation=cv2.INTER_AREA)
     
     return image
 
-def extract_hand_landmarks_fast(image: np.ndarray) -> tuple[Optional[np.ndarray], bool]:
+def extract_hand_landmarks_fast(image: np.ndarray, already_rgb: bool = False) -> tuple[Optional[np.ndarray], bool]:
     """Ultra-fast hand landmark extraction"""
     try:
         start_time = time.perf_counter()
         
-        # Resize for faster processing
-        processed_image = resize_image_fast(image)
+        arena = get_frame_arena()
         
-        # Convert BGR to RGB (MediaPipe requirement)
-        rgb_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB)
+        # Resize for faster processing (into the worker's reusable buffer)
+        processed_image = resize_image_fast(image, arena)
         
-        # Process with MediaPipe
-        results = mp_hands.process(rgb_image)
+        # Convert BGR to RGB (MediaPipe requirement) unless the decoder already did.
+        # The BGR frame is a private decode/resize result, so the channel swap runs in place
+        if already_rgb:
+            rgb_image = processed_image
+        else:
+            rgb_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB, dst=processed_image)
+        
+        # Process with this worker's own MediaPipe instance
+        results = arena.hands.process(rgb_image)
         
         processing_time = (time.perf_counter() - start_time) * 1000
         
@@ -213,14 +461,20 @@ def extract_hand_landmarks_fast(image: np.ndarray) -> tuple[Optional[np.ndarray]
             # Extract first hand landmarks only (fastest path)
             hand_landmarks = results.multi_hand_landmarks[0]
             
-            # Fast feature extraction (list comprehension)
-            features = [coord for landmark in hand_landmarks.landmark 
-                       for coord in (landmark.x, landmark.y, landmark.z)]
+            # Fast feature extraction straight into this worker's preallocated row
+            # (strided per-axis writes - no per-landmark tuples)
+            landmarks = hand_landmarks.landmark
+            features = arena.features
+            features[0::3] = [lm.x for lm in landmarks]
+            features[1::3] = [lm.y for lm in landmarks]
+            features[2::3] = [lm.z for lm in landmarks]
             
-            if processing_time > 30:  # Log slow processing
-                logger.warning(f"⚠️ Slow landmark extraction: {processing_time:.1f}ms")
+            if processing_time > 30:  # Count slow processing
+                count_event(_SLOW_COUNTS, "landmark_frames")
+                if ASL_DEBUG:
+                    logger.warning(f"⚠️ Slow landmark extraction: {processing_time:.1f}ms")
             
-            return np.array(features, dtype=np.float32), True
+            return features, True
         
         return None, False
         
@@ -228,18 +482,85 @@ def extract_hand_landmarks_fast(image: np.ndarray) -> tuple[Optional[np.ndarray]
         logger.error(f"Landmark extraction error: {e}")
         return None, False
 
-def process_frame_sync(image_data: str, timestamp: float) -> dict:
+def jpeg_scaling_factor(width: int, height: int) -> Optional[tuple[int, int]]:
+    """Largest libjpeg-turbo downscale that still leaves the long side >= MAX_FRAME_SIDE"""
+    long_side = max(width, height)
+    for denominator in (8, 4, 2):
+        if long_side // denominator >= MAX_FRAME_SIDE:
+            return (1, denominator)
+    return None
+
+# OpenCV >= 4.11 can decode straight to RGB, skipping the separate cvtColor pass
+_IMREAD_COLOR_RGB = getattr(cv2, "IMREAD_COLOR_RGB", None)
+
+# base64 data URL (text frames), JPEG bytes, or an already-wrapped raw RGB array (binary frames)
+FrameData = Union[str, bytes, memoryview, np.ndarray]
+
+def decode_frame(image_data: FrameData) -> tuple[Optional[np.ndarray], bool]:
+    """Decode a base64 (data URL) or raw JPEG frame - returns the image and whether it is already RGB"""
+    if isinstance(image_data, np.ndarray):
+        return image_data, True  # Raw RGB pixels - nothing to decode
+    if isinstance(image_data, str):
+        if "," in image_data:
+            image_data = image_data.split(",", 1)[1]
+        img_bytes = pybase64.b64decode(image_data)
+    else:
+        img_bytes = image_data
+    
+    if turbo_jpeg is not None:
+        try:
+            # Let libjpeg-turbo drop resolution during the DCT for oversized frames
+            width, height, _, _ = turbo_jpeg.decode_header(img_bytes)
+            return turbo_jpeg.decode(img_bytes, pixel_format=TJPF_RGB,
+                                     scaling_factor=jpeg_scaling_factor(width, height)), True
+        except OSError:
+            pass  # Not a JPEG - let OpenCV handle it
+    
+    np_arr = np.frombuffer(img_bytes, np.uint8)
+    if _IMREAD_COLOR_RGB is not None:
+        return cv2.imdecode(np_arr, _IMREAD_COLOR_RGB), True
+    return cv2.imdecode(np_arr, cv2.IMREAD_COLOR), False
+
+def parse_binary_frame(payload: bytes) -> tuple[dict, FrameData]:
+    """Split a binary message: [uint32 LE header length][JSON header][image bytes].
+    The image is JPEG by default; with {"format": "rgb", "width": W, "height": H}
+    it is raw H x W x 3 RGB pixels, wrapped as an array without decoding or copying."""
+    header_len = int.from_bytes(payload[:4], "little")
+    header = orjson.loads(payload[4:4 + header_len])
+    if not isinstance(header, dict):
+        raise ValueError("Frame header must be a JSON object")
+    image_bytes = memoryview(payload)[4 + header_len:]
+    
+    if header.get("format") == "rgb":
+        width, height = header.get("width"), header.get("height")
+        if not (isinstance(width, int) and isinstance(height, int) and width > 0 and height > 0):
+            raise ValueError("Raw RGB frames need positive integer width and height")
+        if len(image_bytes) != width * height * 3:
+            raise ValueError(f"Expected {width * height * 3} RGB bytes, got {len(image_bytes)}")
+        return header, np.frombuffer(image_bytes, np.uint8).reshape(height, width, 3)
+    
+    return header, image_bytes
+
+@dataclass(slots=True)
+class FrameResult:
+    """Flat per-frame reply - orjson serializes dataclasses natively, no nested dicts to walk"""
+    timestamp: float
+    hand_detected: bool
+    decode_ms: float
+    landmark_ms: float
+    gesture: str = "None"
+    confidence: float = 0.0
+    prediction_ms: float = 0.0
+    total_ms: float = 0.0
+    network_latency_ms: float = 0.0
+
+def process_frame_sync(image_data: FrameData, timestamp: float) -> Union[FrameResult, dict]:
     """Synchronous frame processing for thread pool"""
     try:
         frame_start = time.perf_counter()
         
-        # Decode base64 image (optimized)
-        if "," in image_data:
-            image_data = image_data.split(",", 1)[1]
-        
-        img_bytes = base64.b64decode(image_data)
-        np_arr = np.frombuffer(img_bytes, np.uint8)
-        image = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+        # Decode image (SIMD base64 for text frames + libjpeg-turbo when available)
+        image, is_rgb = decode_frame(image_data)
         
         if image is None:
             return {"error": "Failed to decode image", "timestamp": timestamp}
@@ -248,135 +569,257 @@ def process_frame_sync(image_data: str, timestamp: float) -> dict:
         
         # Extract hand landmarks
         landmark_start = time.perf_counter()
-        features, hand_detected = extract_hand_landmarks_fast(image)
+        features, hand_detected = extract_hand_landmarks_fast(image, already_rgb=is_rgb)
         landmark_time = (time.perf_counter() - landmark_start) * 1000
         
         # Prepare response
-        response = {
-            "timestamp": timestamp,
-            "hand_detected": hand_detected,
-            "gesture": "None",
-            "confidence": 0.0,
-            "processing_times": {
-                "decode_ms": round(decode_time, 1),
-                "landmark_ms": round(landmark_time, 1),
-                "total_ms": 0
-            }
-        }
+        response = FrameResult(
+            timestamp=timestamp,
+            hand_detected=hand_detected,
+            decode_ms=round(decode_time, 1),
+            landmark_ms=round(landmark_time, 1)
+        )
         
         # Predict gesture if hand detected
         if hand_detected and features is not None:
             prediction_start = time.perf_counter()
-            gesture, confidence = asl_model.predict_fast(features)
+            gesture, confidence = predict_unless_unchanged(get_frame_arena(), features)
             prediction_time = (time.perf_counter() - prediction_start) * 1000
             
-            response["gesture"] = gesture
-            response["confidence"] = confidence
-            response["processing_times"]["prediction_ms"] = round(prediction_time, 1)
+            response.gesture = gesture
+            response.confidence = confidence
+            response.prediction_ms = round(prediction_time, 1)
             
-            if confidence > 0.5:  # Only log confident predictions
+            if ASL_DEBUG and confidence > 0.5:  # Only log confident predictions
                 logger.info(f"🤟 {gesture} ({confidence:.2f}) - Total: {round((time.perf_counter() - frame_start) * 1000, 1)}ms")
         
-        response["processing_times"]["total_ms"] = round((time.perf_counter() - frame_start) * 1000, 1)
+        response.total_ms = round((time.perf_counter() - frame_start) * 1000, 1)
         return response
         
     except Exception as e:
         logger.error(f"Frame processing error: {e}")
         return {"error": f"Processing failed: {str(e)}", "timestamp": timestamp}
 
+# Plain ints/bools kept current by the connection manager and the model loader,
+# so status endpoints never walk containers or reach into the model object
+_STATS = {"active_connections": 0, "model_loaded": False, "dropped_frames": 0}
+
 class OptimizedConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.processing_queue = Queue(maxsize=PROCESSING_QUEUE_SIZE)
-        self.connection_lock = threading.RLock()
+        # Keyed by id() so add/remove/membership are O(1) however many clients connect
+        # Only touched from the event loop thread, so no lock is needed
+        self.active_connections: Dict[int, WebSocket] = {}
+        # Caps frames handed to the executor across all connections - more would just queue in the pool
+        self.submit_sem = asyncio.Semaphore(MAX_WORKERS)
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        with self.connection_lock:
-            self.active_connections.append(websocket)
-        logger.info(f"📱 Client connected. Total: {len(self.active_connections)}")
+        self.active_connections[id(websocket)] = websocket
+        _STATS["active_connections"] = len(self.active_connections)
+        logger.info(f"📱 Client connected. Total: {_STATS['active_connections']}")
     
     def disconnect(self, websocket: WebSocket):
-        with self.connection_lock:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
-        logger.info(f"📱 Client disconnected. Total: {len(self.active_connections)}")
+        self.active_connections.pop(id(websocket), None)
+        _STATS["active_connections"] = len(self.active_connections)
+        logger.info(f"📱 Client disconnected. Total: {_STATS['active_connections']}")
 
 manager = OptimizedConnectionManager()
 
+def load_model_and_publish():
+    asl_model.load_model()
+    _STATS["model_loaded"] = asl_model.model_loaded
+
+@app.on_event("startup")
+async def load_model_in_background():
+    """Load the model off the event loop so the server accepts connections immediately"""
+    # Frames fall back to rule-based classification until model_loaded flips to True
+    app.state.model_load_task = asyncio.create_task(asyncio.to_thread(load_model_and_publish))
+    app.state.warmup_task = asyncio.create_task(warm_up_workers())
+    app.state.slow_report_task = asyncio.create_task(report_slow_frames())
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """Cancel the periodic slow-frame report so it doesn't outlive the app"""
+    app.state.slow_report_task.cancel()
+
+def warm_up_worker(barrier: threading.Barrier):
+    """Build this thread's arena and push one blank frame through resize, color swap and MediaPipe"""
+    try:
+        # Hold every task until all are running, so each lands on a different pool thread
+        barrier.wait(timeout=5.0)
+    except threading.BrokenBarrierError:
+        pass
+    extract_hand_landmarks_fast(np.zeros((480, 640, 3), dtype=np.uint8))
+
+async def warm_up_workers():
+    """Pay MediaPipe's graph start-up on every worker before the first client frame does"""
+    loop = asyncio.get_running_loop()
+    barrier = threading.Barrier(MAX_WORKERS)
+    start_time = time.perf_counter()
+    await asyncio.gather(*(loop.run_in_executor(executor, warm_up_worker, barrier)
+                           for _ in range(MAX_WORKERS)))
+    logger.info(f"🔥 {MAX_WORKERS} frame workers warmed up in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+
+async def report_slow_frames():
+    """One summary line per interval instead of a warning per slow frame"""
+    last = snapshot_counts(_SLOW_COUNTS)
+    while True:
+        await asyncio.sleep(SLOW_REPORT_INTERVAL_S)
+        current = snapshot_counts(_SLOW_COUNTS)
+        inference = current["inference_batches"] - last["inference_batches"]
+        landmarks = current["landmark_frames"] - last["landmark_frames"]
+        if inference or landmarks:
+            logger.warning(f"⚠️ Last {SLOW_REPORT_INTERVAL_S:.0f}s: {inference} slow inference batches (>50ms), "
+                           f"{landmarks} slow landmark frames (>30ms)")
+        last = current
+
+async def send_json_fast(websocket: WebSocket, payload: Union[FrameResult, dict]):
+    """orjson-encoded text frame - the mobile client JSON.parses text messages"""
+    await websocket.send_text(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode())
+
+async def process_and_send(websocket: WebSocket, frame: FrameData, timestamp: float,
+                           receive_time: float, client_timestamp: float):
+    """Run one frame through the thread pool and send its result back"""
+    try:
+        # Single hop onto the dedicated pool - no second thread parked on future.result()
+        loop = asyncio.get_running_loop()
+        await manager.submit_sem.acquire()
+        try:
+            future = executor.submit(process_frame_sync, frame, timestamp)
+        except BaseException:
+            manager.submit_sem.release()
+            raise
+        # The slot frees when the pool thread is actually done, not when wait_for gives up on it
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(manager.submit_sem.release))
+        result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=FRAME_TIMEOUT_S)
+        
+        # Add network latency info (error replies stay plain dicts without it)
+        if isinstance(result, FrameResult):
+            result.network_latency_ms = round((receive_time * 1000) - client_timestamp, 1)
+        
+        # Send response immediately
+        await send_json_fast(websocket, result)
+        
+    except Exception as e:
+        logger.error(f"Processing error: {e}")
+        try:
+            await send_json_fast(websocket, {
+                "error": f"Processing failed: {str(e)}", 
+                "timestamp": timestamp
+            })
+        except Exception:
+            pass  # Socket already closed - the receive loop handles cleanup
+
 @app.websocket("/asl-ws")
 async def asl_websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
+    # Newest frame wins: the reader never blocks, it just overwrites this slot. One worker
+    # takes whatever is newest, so a slow server drops stale frames instead of building a
+    # backlog in the socket - and replies always go out in frame order
+    latest_frame = None
+    frame_ready = asyncio.Event()
+    warned_text_frames = False
+    
+    async def frame_worker():
+        nonlocal latest_frame
+        while True:
+            await frame_ready.wait()
+            frame_args = latest_frame
+            latest_frame = None
+            frame_ready.clear()
+            await process_and_send(websocket, *frame_args)
+    
+    worker = asyncio.create_task(frame_worker())
     
     try:
         while True:
-            # Receive frame data
-            data = await websocket.receive_text()
+            # Receive frame data - binary or text, whichever the client sent
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
             receive_time = time.perf_counter()
             
-            try:
-                frame_data = json.loads(data)
-            except json.JSONDecodeError:
-                await websocket.send_json({"error": "Invalid JSON data"})
-                continue
-            
-            if "frame" not in frame_data:
-                continue
+            if message.get("bytes") is not None:
+                # JPEG or raw RGB behind a small JSON header - no base64 and no UTF-8 decode
+                try:
+                    frame_data, frame = parse_binary_frame(message["bytes"])
+                except ValueError:
+                    await send_json_fast(websocket, {"error": "Invalid binary frame header"})
+                    continue
+            else:
+                try:
+                    frame_data = orjson.loads(message["text"])
+                except orjson.JSONDecodeError:
+                    await send_json_fast(websocket, {"error": "Invalid JSON data"})
+                    continue
+                
+                if "frame" not in frame_data:
+                    continue
+                
+                frame = frame_data["frame"]
+                if not warned_text_frames:
+                    logger.warning("⚠️ Client is sending base64 text frames - binary JPEG frames are faster")
+                    warned_text_frames = True
             
             # Get timestamp for latency measurement
             timestamp = frame_data.get("timestamp", receive_time)
             client_timestamp = frame_data.get("client_timestamp", receive_time * 1000)
             
-            # CRITICAL: Process frame in thread pool for non-blocking operation
-            try:
-                # Submit to thread pool for parallel processing
-                future = executor.submit(
-                    process_frame_sync, 
-                    frame_data["frame"], 
-                    timestamp
-                )
-                
-                # Wait for result with timeout to prevent blocking
-                result = await asyncio.get_event_loop().run_in_executor(None, future.result, 2.0)
-                
-                # Add network latency info
-                result["network_latency_ms"] = round((receive_time * 1000) - client_timestamp, 1)
-                
-                # Send response immediately
-                await websocket.send_json(result)
-                
-            except Exception as e:
-                logger.error(f"Processing error: {e}")
-                await websocket.send_json({
-                    "error": f"Processing failed: {str(e)}", 
-                    "timestamp": timestamp
-                })
+            # Hand the frame to the worker (replacing any frame it hasn't picked up yet)
+            if latest_frame is not None:
+                count_event(_STATS, "dropped_frames")
+            latest_frame = (frame, timestamp, receive_time, client_timestamp)
+            frame_ready.set()
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         manager.disconnect(websocket)
+    finally:
+        worker.cancel()
+
+# Probe-class endpoints (/health, /health/ready, /performance, /) must stay async and I/O-free:
+# they run straight on the event loop, so a saturated thread pool can't starve them.
+# No Depends(), no filesystem reads, no locks - only in-memory attributes.
+# Liveness - the process is up and serving; constant, encoded once by the interceptor
+LIVENESS_STATUS = {"status": "ok"}
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "model_loaded": asl_model.model_loaded,
-        "active_connections": len(manager.active_connections),
+    # Normally answered by HealthCheckInterceptor; kept so the route shows up in /docs
+    return LIVENESS_STATUS
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness - 503 until the background model load and worker warm-up have finished"""
+    startup_tasks = (getattr(app.state, "model_load_task", None), getattr(app.state, "warmup_task", None))
+    ready = all(task is not None and task.done() for task in startup_tasks)
+    status = {
+        "status": "ready" if ready else "loading",
+        "model_loaded": _STATS["model_loaded"],
+        "active_connections": _STATS["active_connections"],
         "thread_pool_size": MAX_WORKERS,
         "optimization_mode": "ultra_fast"
     }
+    if not ready:
+        return ORJSONResponse(status, status_code=503)
+    return status
 
 @app.get("/performance")
 async def performance_info():
     """Performance monitoring endpoint"""
     return {
-        "target_image_size": TARGET_IMAGE_SIZE,
+        "max_frame_side": MAX_FRAME_SIDE,
         "jpeg_quality": JPEG_QUALITY,
         "mediapipe_model": "lite",
         "thread_pool_workers": MAX_WORKERS,
-        "processing_queue_size": PROCESSING_QUEUE_SIZE
+        "inference_threads": INFERENCE_THREADS,
+        "max_concurrent_frames": MAX_WORKERS,
+        "max_inference_batch_size": MAX_BATCH_SIZE,
+        "slow_inference_batches": _SLOW_COUNTS["inference_batches"],
+        "slow_landmark_frames": _SLOW_COUNTS["landmark_frames"],
+        "dropped_stale_frames": _STATS["dropped_frames"]
     }
 
 @app.get("/")
@@ -389,27 +832,48 @@ async def root():
             "Optimized image resizing",
             "Fast rule-based fallback",
             "Thread-safe model inference",
+            "Micro-batched inference across connections",
             "Performance monitoring"
         ],
         "endpoints": {
             "websocket": "/asl-ws",
             "health": "/health",
+            "readiness": "/health/ready",
             "performance": "/performance"
         }
     }
 
+# Serve this (not `app`) - health probes skip the middleware stack and routing
+asgi_app = HealthCheckInterceptor(app, LIVENESS_STATUS)
+
+class HealthProbeLogFilter(logging.Filter):
+    """Drop health-probe lines from the uvicorn access log"""
+    def filter(self, record: logging.LogRecord) -> bool:
+        return "/health" not in record.getMessage()
+
 if __name__ == "__main__":
     import uvicorn
+    # Each worker is a separate process with its own model, batcher and thread pool
+    workers = int(os.environ.get("WORKERS", "1"))
+    access_log = os.environ.get("ACCESS_LOG", "0") == "1"
+    
     logger.info("🚀 Starting OPTIMIZED ASL Translation Server...")
     logger.info(f"⚡ Thread pool size: {MAX_WORKERS}")
-    logger.info(f"📐 Target image size: {TARGET_IMAGE_SIZE}")
+    logger.info(f"👷 Worker processes: {workers}")
+    logger.info(f"📐 Max frame side: {MAX_FRAME_SIDE}px")
     logger.info(f"🧠 MediaPipe model: Lite (fastest)")
     
+    if access_log:
+        logging.getLogger("uvicorn.access").addFilter(HealthProbeLogFilter())
+    
     uvicorn.run(
-        app, 
+        # Multiple workers need an import string; a single one reuses this already-imported module
+        "main:asgi_app" if workers > 1 else asgi_app,
         host="0.0.0.0", 
         port=8000,
         log_level="info",
-        access_log=False,  # Disable access logs for performance
-        workers=1  # Single worker to avoid model loading multiple times
-    )
\ No newline at end of file
+        loop="auto",  # uvloop when installed (not on Windows), else asyncio
+        http="auto",  # httptools when installed, else h11
+        access_log=access_log,  # Off by default for performance
+        workers=workers
+    )
@@ -1,5 +1,6 @@
 import tensorflow as tf
 import numpy as np
+import joblib
 import os
 import logging
 
@@ -19,4 +20,14 @@ try:
     else:
         logger.warning("No serving_default signature found.")
 except Exception as e:
-    logger.error(f"Error loading model with saved_model.load: {e}")
\ No newline at end of file
+    logger.error(f"Error loading model with saved_model.load: {e}")
+
+rf_model_path = os.path.join(os.path.dirname(model_path), "asl_model.pkl")
+try:
+    # Tree arrays are memory-mapped read-only, so every worker process shares one page-cache copy
+    rf_model = joblib.load(rf_model_path, mmap_mode="r")
+    logger.info("Random Forest loaded successfully using joblib (mmap)!")
+    _ = rf_model.predict_proba(np.zeros((1, 63), dtype=np.float32))
+    logger.info("Random Forest warmed up successfully!")
+except Exception as e:
+    logger.error(f"Error loading Random Forest with joblib.load: {e}")
\ No newline at end of file
@@ -0,0 +1,47 @@
+import asyncio
+
+from health_interceptor import HealthCheckInterceptor
+
+
+async def passthrough_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def call(method, path="/health"):
+    interceptor = HealthCheckInterceptor(passthrough_app, {"status": "ok"})
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(interceptor({"type": "http", "method": method, "path": path}, None, send))
+    start, body = messages
+    return start["status"], dict(start["headers"]), body["body"]
+
+
+def test_get_serves_payload():
+    status, headers, body = call("GET")
+    assert status == 200
+    assert body == b'{"status":"ok"}'
+    assert headers[b"content-length"] == str(len(body)).encode()
+
+
+def test_head_matches_get_without_body():
+    get_status, get_headers, get_body = call("GET")
+    status, headers, body = call("HEAD")
+    assert status == get_status
+    assert headers == get_headers
+    assert headers[b"content-length"] == str(len(get_body)).encode()
+    assert body == b""
+
+
+def test_other_methods_not_allowed():
+    status, headers, _ = call("POST")
+    assert status == 405
+    assert headers[b"allow"] == b"GET, HEAD"
+
+
+def test_other_paths_pass_through():
+    status, _, _ = call("GET", path="/performance")
+    assert status == 204
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+import main
+
+
+def save_tiny_savedmodel(path):
+    """Smallest model with the serving signature the server expects: (N, 63) -> (N, 5) probabilities"""
+    model = tf.keras.Sequential([tf.keras.layers.Input(shape=(63,)),
+                                 tf.keras.layers.Dense(len(main.LABELS), activation="softmax")])
+    serving_fn = tf.function(lambda features: model(features, training=False),
+                             input_signature=[tf.TensorSpec([None, 63], tf.float32, name="features")])
+    tf.saved_model.save(model, str(path), signatures={"serving_default": serving_fn})
+
+
+def test_corrupt_tflite_falls_back_to_savedmodel(tmp_path):
+    (tmp_path / "asl_model.tflite").write_bytes(b"not a flatbuffer")
+    save_tiny_savedmodel(tmp_path / "asl_model_tf")
+
+    model = main.OptimizedASLModel()
+    model.load_model(models_dir=str(tmp_path))
+
+    assert model.model_loaded
+    assert isinstance(model.predictor, main.SavedModelPredictor)
+    gesture, confidence = model.predict_batch_fast(np.zeros((1, 63), dtype=np.float32), 1)[0]
+    assert gesture in main.LABELS
+    assert 0.0 <= confidence <= 1.0
+
+
+def test_missing_models_use_rule_based_fallback(tmp_path):
+    model = main.OptimizedASLModel()
+    model.load_model(models_dir=str(tmp_path))
+
+    assert not model.model_loaded
+    assert model.predictor is None
@@ -1,36 +1,87 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-import pandas as pd
-import pickle
+import joblib
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.metrics import accuracy_score
 import tensorflow as tf
 from tensorflow.keras import layers, models
+import argparse
+import json
 import time
 import os
+import shutil
+from typing import Optional
 
-# Initialize MediaPipe Hands
-mp_hands = mp.solutions.hands.Hands(
-    static_image_mode=False,
-    max_num_hands=1,
-    min_detection_confidence=0.7,  # Higher confidence for better detection
-    min_tracking_confidence=0.7
-)
+def create_hands_detector():
+    """MediaPipe Hands for one collection session - same lite model as the server's extractor"""
+    return mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        min_detection_confidence=0.7,  # Higher confidence for better detection
+        min_tracking_confidence=0.7,
+        model_complexity=0  # Lite model, so training features match what the server sees
+    )
+
+# Mixed precision only pays off on a GPU - CPU training stays in float32
+if tf.config.list_physical_devices("GPU"):
+    tf.keras.mixed_precision.set_global_policy("mixed_float16")
 
 # Define labels - REAL ASL GESTURES
 LABELS = ["Yes", "No", "I Love You", "Hello", "Thank You"]
 
-def collect_data_for_sign(sign: str, num_samples: int = 120):
-    """Fast data collection with manual control - closer to original speed."""
+# Below this many samples for any gesture the split and both models are mostly noise
+MIN_SAMPLES_PER_CLASS = 10
+
+# Samples recorded per gesture in one training session
+SAMPLES_PER_SIGN = 120
+
+# The forest grows this many trees per round until its out-of-bag score stops improving
+RF_TREES_PER_ROUND = 25
+
+# Hand crops whose 64-bit dHash is within this many bits of the last kept sample are skipped
+DUPLICATE_HASH_DISTANCE = 4
+HAND_BOX_MARGIN = 0.2  # Crop padding around the landmarks, as a fraction of the box size
+
+def hand_box(landmarks, frame_shape: tuple) -> tuple:
+    """Pixel (x0, y0, x1, y1) around the hand's landmarks, padded and clipped to the frame"""
+    height, width = frame_shape[:2]
+    xs = [lm.x for lm in landmarks]
+    ys = [lm.y for lm in landmarks]
+    pad_x = (max(xs) - min(xs)) * HAND_BOX_MARGIN
+    pad_y = (max(ys) - min(ys)) * HAND_BOX_MARGIN
+    x0 = max(0, int((min(xs) - pad_x) * width))
+    y0 = max(0, int((min(ys) - pad_y) * height))
+    x1 = min(width, int((max(xs) + pad_x) * width) + 1)
+    y1 = min(height, int((max(ys) + pad_y) * height) + 1)
+    return x0, y0, x1, y1
+
+def frame_dhash(frame: np.ndarray, box: tuple) -> Optional[int]:
+    """64-bit difference hash of the hand crop of a BGR frame - near-identical poses differ in only a few bits.
+    Hashing the crop, not the whole frame, keeps the static background from outvoting the hand."""
+    x0, y0, x1, y1 = box
+    crop = frame[y0:y1, x0:x1]
+    if crop.size == 0:
+        return None
+    small = cv2.resize(cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY), (9, 8), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()  # comparison result is contiguous - a view, not a copy
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+def collect_data_for_sign(sign: str, num_samples: int = SAMPLES_PER_SIGN, out: np.ndarray = None):
+    """Fast data collection with manual control - closer to original speed.
+    Rows are written into `out` (num_samples, 63) when given; returns the filled slice."""
     cap = cv2.VideoCapture(0)
+    hands = create_hands_detector()
     print(f"\n🎯 Collecting '{sign}' - Press ENTER when ready, then 'E' to start!")
     input("Press ENTER to begin...")
     
-    features = []
+    # Preallocated (num_samples, 63) float32 buffer - rows are filled in place
+    features = out if out is not None else np.empty((num_samples, 63), dtype=np.float32)
     count = 0
     collecting = False
+    last_hash = None
+    last_box = None
     
     print(f"🔴 Press 'E' to START collecting '{sign}'")
     
@@ -41,8 +92,22 @@ def collect_data_for_sign(sign: str, num_samples: int = 120):
             
         # Flip for mirror effect
         frame = cv2.flip(frame, 1)
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = mp_hands.process(frame_rgb)
+        
+        # Held pose hasn't moved since the last kept sample - skip MediaPipe and the redundant row.
+        # Compared over the same region the last sample's hand occupied
+        frame_hash = frame_dhash(frame, last_box) if collecting and last_box is not None else None
+        is_duplicate = (last_hash is not None and frame_hash is not None
+                        and bin(frame_hash ^ last_hash).count("1") <= DUPLICATE_HASH_DISTANCE)
+        if is_duplicate:
+            results = None
+        else:
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            results = hands.process(frame_rgb)
+        
+        # Hash the new hand crop now, before the overlay text is drawn onto the frame
+        if collecting and results is not None and results.multi_hand_landmarks:
+            sample_box = hand_box(results.multi_hand_landmarks[0].landmark, frame.shape)
+            sample_hash = frame_dhash(frame, sample_box)
         
         # Show status
         status = "🔴 RECORDING" if collecting else "⏸️ PAUSED"
@@ -54,11 +119,18 @@ def collect_data_for_sign(sign: str, num_samples: int = 120):
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
         
         # Collect data when recording and hand detected
-        if collecting and results.multi_hand_landmarks:
+        if is_duplicate:
+            cv2.putText(frame, "⏭️ Same pose - move slightly", (10, 110), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+        elif collecting and results.multi_hand_landmarks:
             landmarks = results.multi_hand_landmarks[0].landmark
-            feature = np.array([[lm.x, lm.y, lm.z] for lm in landmarks]).flatten()
-            features.append(feature)
+            # Strided per-axis writes into the preallocated row - no per-landmark tuples
+            row = features[count]
+            row[0::3] = [lm.x for lm in landmarks]
+            row[1::3] = [lm.y for lm in landmarks]
+            row[2::3] = [lm.z for lm in landmarks]
             count += 1
+            last_box, last_hash = sample_box, sample_hash
             
             # Visual feedback
             cv2.putText(frame, "✅ CAPTURED!", (10, 110), 
@@ -71,7 +143,7 @@ def collect_data_for_sign(sign: str, num_samples: int = 120):
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
         
         # Draw hand landmarks if detected
-        if results.multi_hand_landmarks:
+        if results is not None and results.multi_hand_landmarks:
             mp.solutions.drawing_utils.draw_landmarks(
                 frame, results.multi_hand_landmarks[0], 
                 mp.solutions.hands.HAND_CONNECTIONS)
@@ -91,22 +163,57 @@ def collect_data_for_sign(sign: str, num_samples: int = 120):
             break
     
     cap.release()
+    hands.close()
     cv2.destroyAllWindows()
-    print(f"✅ Completed '{sign}' - {len(features)} samples collected")
-    return features
+    print(f"✅ Completed '{sign}' - {count} samples collected")
+    return features[:count]
 
-def save_data_to_csv(X: np.ndarray, y: np.ndarray, filename: str = "asl_data.csv"):
-    """Save features and labels to a CSV file."""
+def split_indices(y: np.ndarray, test_size: float = 0.2, seed: int = 42):
+    """Stratified train/test index arrays - plain shuffle when a class is too small to stratify"""
+    sss = StratifiedShuffleSplit(n_splits=1, test_size=test_size, random_state=seed)
+    try:
+        (train_idx, test_idx), = sss.split(np.zeros(len(y)), y)
+    except ValueError:
+        idx = np.random.default_rng(seed).permutation(len(y))
+        cut = int((1 - test_size) * len(y))
+        train_idx, test_idx = idx[:cut], idx[cut:]
+    return train_idx, test_idx
+
+def save_data_to_csv(X: np.ndarray, y: np.ndarray, filename: str = "asl_data.csv",
+                     chunk_rows: int = 10000):
+    """Save features and labels to a CSV file, streamed in row chunks (no DataFrame copy)."""
     columns = [f"landmark_{i}_{dim}" for i in range(21) for dim in ["x", "y", "z"]]
-    df = pd.DataFrame(X, columns=columns)
-    df["label"] = y
-    df.to_csv(filename, index=False)
+    row_format = ["%.6g"] * X.shape[1] + ["%d"]
+    with open(filename, "w", newline="", buffering=1 << 20) as f:
+        f.write(",".join(columns + ["label"]) + "\n")
+        for start in range(0, len(X), chunk_rows):
+            stop = start + chunk_rows
+            np.savetxt(f, np.column_stack((X[start:stop], y[start:stop])),
+                       fmt=row_format, delimiter=",")
     print(f"💾 Data saved to {filename}")
 
-def create_tensorflow_model(input_shape: tuple, num_classes: int):
+def save_data_memmap(X: np.ndarray, y: np.ndarray, filename: str = "asl_data.f32"):
+    """Save features + label column as a raw float32 (N, 64) memmap with a JSON shape sidecar."""
+    shape = (X.shape[0], X.shape[1] + 1)
+    mm = np.memmap(filename, dtype=np.float32, mode="w+", shape=shape)
+    mm[:, :-1] = X
+    mm[:, -1] = y
+    mm.flush()
+    del mm
+    # Readers: np.memmap(filename, dtype=float32, mode="r", shape=sidecar["shape"])
+    with open(os.path.splitext(filename)[0] + ".json", "w") as f:
+        json.dump({"shape": list(shape), "dtype": "float32", "label_column": shape[1] - 1}, f)
+    print(f"💾 Memory-mappable data saved to {filename}")
+
+def create_tensorflow_model(input_shape: tuple, num_classes: int, X_adapt: np.ndarray = None):
     """Create an improved TensorFlow neural network model."""
+    # Standardization lives inside the model, so the saved artifacts apply it at inference
+    normalization = layers.Normalization(axis=-1)
+    if X_adapt is not None:
+        normalization.adapt(X_adapt)
     model = models.Sequential([
         layers.Input(shape=input_shape),
+        normalization,
         layers.Dense(256, activation="relu"),
         layers.BatchNormalization(),
         layers.Dropout(0.3),
@@ -115,18 +222,56 @@ def create_tensorflow_model(input_shape: tuple, num_classes: int):
         layers.Dropout(0.3),
         layers.Dense(64, activation="relu"),
         layers.Dropout(0.2),
-        layers.Dense(num_classes, activation="softmax")
+        layers.Dense(num_classes, activation="softmax", dtype="float32")  # float32 softmax for stability
     ])
     model.compile(
         optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
         loss="sparse_categorical_crossentropy", 
-        metrics=["accuracy"]
+        metrics=["accuracy"],
+        jit_compile=True  # XLA fuses the Dense/BN/Dropout stack per train step
     )
     return model
 
+def export_tflite_int8(tf_model, X_sample: np.ndarray, filename: str = "models/asl_model.tflite"):
+    """Convert the trained network to a full-integer (int8 in/out) TFLite model for serving."""
+    def representative_dataset():
+        for feature in X_sample[:200]:
+            yield [feature.reshape(1, -1).astype(np.float32)]
+    
+    # Under mixed_float16 the graph is full of float16 Casts the int8-only converter can't take -
+    # rebuild the same network in float32 and copy the (float32) trained weights into it
+    policy = tf.keras.mixed_precision.global_policy()
+    if policy.name != "float32":
+        tf.keras.mixed_precision.set_global_policy("float32")
+        try:
+            float_model = create_tensorflow_model(tf_model.input_shape[1:], tf_model.output_shape[-1])
+            float_model.set_weights(tf_model.get_weights())
+        finally:
+            tf.keras.mixed_precision.set_global_policy(policy)
+        tf_model = float_model
+    
+    converter = tf.lite.TFLiteConverter.from_keras_model(tf_model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    # Integer-only graph end to end - the server quantizes inputs and dequantizes the top score
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    with open(filename, "wb") as f:
+        f.write(converter.convert())
+    print(f"💾 Int8 TFLite model saved to '{filename}'")
+
+def export_tflite_from_saved_model(model_path: str = "models/asl_model_tf",
+                                   filename: str = "models/asl_model.tflite"):
+    """Convert an already-trained SavedModel to a dynamic-range quantized TFLite model (no retraining)."""
+    converter = tf.lite.TFLiteConverter.from_saved_model(model_path)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    with open(filename, "wb") as f:
+        f.write(converter.convert())
+    print(f"💾 Dynamic-range TFLite model saved to '{filename}'")
+
 def clean_old_models():
     """SAFELY remove only ASL model files - nothing else."""
-    import shutil
     import glob
     import platform
     import subprocess
@@ -137,70 +282,43 @@ def clean_old_models():
     safe_targets = [
         "models/asl_model.pkl",     # Our pickle model  
         "models/asl_model_tf",      # Our TensorFlow model directory
+        "models/asl_model.tflite",  # Our quantized TFLite model
         "asl_data.csv",             # Our training data CSV
+        "asl_data.f32",             # Our memory-mappable training data
+        "asl_data.json",            # ...and its shape sidecar
         "asl_model_tf",             # DUPLICATE in root (wrong location)
         "asl_model.pkl",            # DUPLICATE in root (wrong location)
-        "models"                    # Our models directory (only if empty or contains our files)
     ]
     
-    # Check what's in models directory before deleting
-    models_contents = []
-    if os.path.exists("models"):
-        try:
-            models_contents = os.listdir("models")
-            print(f"📁 Models directory contains: {models_contents}")
-            
-            # Only delete if it contains our ASL files or is empty
-            our_files = ["asl_model.pkl", "asl_model_tf"]
-            safe_to_delete = all(item in our_files or item.startswith("asl_") for item in models_contents)
-            
-            if len(models_contents) == 0:
-                print("📁 Models directory is empty - safe to delete")
-                safe_to_delete = True
-            elif not safe_to_delete:
-                print(f"⚠️ WARNING: Models directory contains non-ASL files: {models_contents}")
-                print("⚠️ Skipping models directory deletion for safety")
-        except Exception as e:
-            print(f"⚠️ Could not check models directory: {e}")
-            safe_to_delete = False
-    else:
-        safe_to_delete = True
-    
-    # Delete individual ASL files first
-    for target in safe_targets[:-1]:  # Skip "models" directory for now
+    # Delete only our ASL artifacts - the models directory itself (and anything else in it) stays
+    for target in safe_targets:
         try:
-            if os.path.exists(target):
-                if os.path.isdir(target):
-                    shutil.rmtree(target)
-                    print(f"🗑️ Deleted ASL directory: {target}")
-                else:
-                    os.remove(target)
-                    print(f"🗑️ Deleted ASL file: {target}")
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+                print(f"🗑️ Deleted ASL directory: {target}")
             else:
-                print(f"✅ {target} does not exist")
+                os.remove(target)
+                print(f"🗑️ Deleted ASL file: {target}")
+        except FileNotFoundError:
+            print(f"✅ {target} does not exist")
         except Exception as e:
             print(f"⚠️ Could not delete {target}: {e}")
     
-    # Only delete models directory if it's safe
-    if safe_to_delete and os.path.exists("models"):
-        try:
-            shutil.rmtree("models")
-            print("🗑️ Safely deleted models directory")
-        except Exception as e:
-            print(f"⚠️ Could not delete models directory: {e}")
-    
-    # Recreate clean models directory
+    # Make sure the models directory exists for the new artifacts
     try:
         os.makedirs("models", exist_ok=True)
-        print("✅ Created fresh models directory")
     except Exception as e:
         print(f"⚠️ Could not create models directory: {e}")
     
-    # Verify only our ASL files are gone
-    remaining_asl_files = []
-    for target in safe_targets[:-1]:
-        if os.path.exists(target):
-            remaining_asl_files.append(target)
+    # Verify only our ASL files are gone - one directory read per parent instead of a stat per target
+    present = set()
+    for directory in {os.path.dirname(target) or "." for target in safe_targets}:
+        try:
+            with os.scandir(directory) as entries:
+                present.update(os.path.normpath(os.path.join(directory, entry.name)) for entry in entries)
+        except FileNotFoundError:
+            pass
+    remaining_asl_files = [target for target in safe_targets if os.path.normpath(target) in present]
     
     if remaining_asl_files:
         print(f"⚠️ Some ASL files still exist: {remaining_asl_files}")
@@ -209,58 +327,102 @@ def clean_old_models():
     
     print("✅ SAFE cleanup complete - only ASL files affected!")
 
-def train_model():
+def train_model(dump_csv: bool = False):
     """Fast training with improved model architecture."""
     print("🚀 Starting FRESH ASL Model Training")
     print("=" * 50)
     
-    # Clean old models first
-    clean_old_models()
-    
-    X, y = [], []
+    # Whole dataset preallocated up front - each gesture fills its own slice in place
+    upper_bound = len(LABELS) * SAMPLES_PER_SIGN
+    X = np.empty((upper_bound, 63), dtype=np.float32)
+    y = np.empty(upper_bound, dtype=np.int16)
+    n_samples = 0
     
     # Fast data collection for each sign
     for i, sign in enumerate(LABELS):
         print(f"\n📋 [{i+1}/{len(LABELS)}] Training '{sign}'")
-        features = collect_data_for_sign(sign, num_samples=120)
+        features = collect_data_for_sign(sign, num_samples=SAMPLES_PER_SIGN,
+                                         out=X[n_samples:n_samples + SAMPLES_PER_SIGN])
         if len(features) > 0:
-            X.extend(features)
-            y.extend([i] * len(features))
+            y[n_samples:n_samples + len(features)] = i
+            n_samples += len(features)
             print(f"✅ Added {len(features)} samples for '{sign}'")
         else:
             print(f"⚠️ No samples for '{sign}'")
     
-    if len(X) == 0:
+    if n_samples == 0:
         print("❌ No training data collected!")
         return
     
-    X = np.array(X)
-    y = np.array(y)
+    # Views over the filled prefix - no concatenation copy
+    X = X[:n_samples]
+    y = y[:n_samples]
     
     print(f"\n📊 Total dataset: {len(X)} samples across {len(LABELS)} gestures")
     
-    # Save training data
-    save_data_to_csv(X, y)
+    class_counts = np.bincount(y, minlength=len(LABELS))
+    if class_counts.min() < MIN_SAMPLES_PER_CLASS:
+        print(f"❌ Need at least {MIN_SAMPLES_PER_CLASS} samples per gesture - "
+              f"got {dict(zip(LABELS, class_counts.tolist()))}")
+        return
+    
+    # Scale the training budget with the dataset instead of fixed worst-case settings
+    total_samples = int(class_counts.sum())
+    n_estimators = min(200, max(50, 5 * total_samples // len(LABELS)))  # Upper bound for the OOB growth loop
+    epochs = min(100, max(20, total_samples // 4))
+    batch_size = min(256, max(16, total_samples // 20))
+    
+    # Clean old models only once this session is known to produce new ones -
+    # an aborted or rejected recording leaves the current model in place
+    clean_old_models()
+    
+    # Save training data (opt-in - it is not needed to train)
+    if dump_csv:
+        save_data_to_csv(X, y)
+        save_data_memmap(X, y)
     
     # Split data with stratification to ensure balanced classes
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
+    # (index arrays, then one fancy-index copy per split)
+    train_idx, test_idx = split_indices(y)
+    X_train, X_test, y_train, y_test = X[train_idx], X[test_idx], y[train_idx], y[test_idx]
     
     print(f"🔄 Training: {len(X_train)} samples")
     print(f"🧪 Testing: {len(X_test)} samples")
     
+    # "Balanced" weights from one bincount - gestures recorded with fewer samples count more
+    train_counts = np.bincount(y_train, minlength=len(LABELS))
+    class_weights = {i: float(weight) for i, weight in
+                     enumerate(len(y_train) / (len(LABELS) * np.maximum(train_counts, 1)))}
+    
     # Train Random Forest with better parameters
+    # (float32 features go straight into sklearn's trees without a conversion copy)
     print("\n🌳 Training Random Forest...")
     rf_model = RandomForestClassifier(
-        n_estimators=300,  # More trees
+        n_estimators=min(RF_TREES_PER_ROUND, n_estimators),
         max_depth=15,      # Deeper trees
         min_samples_split=5,
         min_samples_leaf=2,
+        max_features="sqrt",
+        class_weight=class_weights,  # Explicit dict - the "balanced" preset warns under warm_start
+        bootstrap=True,
+        max_samples=0.8,   # Each tree sees 80% of the rows - less work per tree
+        oob_score=True,    # Held-out rows per tree give a free accuracy estimate
+        warm_start=True,   # Refitting keeps existing trees and only adds new ones
         random_state=42,
         n_jobs=-1  # Use all CPU cores
     )
-    rf_model.fit(X_train, y_train)
+    # Add trees until the OOB score plateaus for 2 rounds (or the n_estimators cap is hit)
+    best_oob, stale_rounds = -1.0, 0
+    while True:
+        rf_model.fit(X_train, y_train)
+        if rf_model.oob_score_ > best_oob + 1e-3:
+            best_oob, stale_rounds = rf_model.oob_score_, 0
+        else:
+            stale_rounds += 1
+        if stale_rounds >= 2 or rf_model.n_estimators >= n_estimators:
+            break
+        rf_model.n_estimators = min(rf_model.n_estimators + RF_TREES_PER_ROUND, n_estimators)
+    print(f"🌲 {rf_model.n_estimators} trees (OOB score {rf_model.oob_score_:.3f})")
     rf_predictions = rf_model.predict(X_test)
     rf_accuracy = accuracy_score(y_test, rf_predictions)
     print(f"✅ Random Forest accuracy: {rf_accuracy:.3f}")
@@ -268,21 +430,37 @@ def train_model():
     # Create models directory
     os.makedirs("models", exist_ok=True)
     
-    # Save Random Forest model
-    with open("models/asl_model.pkl", "wb") as f:
-        pickle.dump(rf_model, f)
+    # Save Random Forest model - uncompressed joblib keeps the tree arrays
+    # out-of-band so loaders can memory-map them (joblib.load(mmap_mode="r"))
+    joblib.dump(rf_model, "models/asl_model.pkl", compress=0, protocol=5)
     print("💾 Random Forest saved to 'models/asl_model.pkl'")
     
     # Train improved TensorFlow model
     print("\n🧠 Training Neural Network...")
-    tf_model = create_tensorflow_model(input_shape=(X.shape[1],), num_classes=len(LABELS))
+    # Explicit validation split, computed once instead of by Keras on every fit
+    fit_idx, val_idx = split_indices(y_train)
+    X_fit, X_val, y_fit, y_val = X_train[fit_idx], X_train[val_idx], y_train[fit_idx], y_train[val_idx]
+    
+    # Normalization statistics come from the fit rows only
+    tf_model = create_tensorflow_model(input_shape=(X.shape[1],), num_classes=len(LABELS), X_adapt=X_fit)
+    
+    # In-memory tf.data pipeline - the next batch is prepared while the current one trains
+    train_ds = (tf.data.Dataset.from_tensor_slices((X_fit, y_fit))
+                .cache()
+                .shuffle(len(X_fit))
+                .batch(batch_size)
+                .prefetch(tf.data.AUTOTUNE))
+    val_ds = (tf.data.Dataset.from_tensor_slices((X_val, y_val))
+              .batch(batch_size)
+              .cache()
+              .prefetch(tf.data.AUTOTUNE))
     
     # Train with better parameters
     history = tf_model.fit(
-        X_train, y_train,
-        epochs=100,  # More epochs
-        batch_size=16,  # Smaller batches
-        validation_split=0.2,
+        train_ds,
+        validation_data=val_ds,
+        epochs=epochs,  # Up to 100 - early stopping usually ends sooner
+        class_weight=class_weights,
         verbose=1,
         callbacks=[
             tf.keras.callbacks.EarlyStopping(patience=10, restore_best_weights=True),
@@ -295,9 +473,18 @@ def train_model():
     print(f"✅ Neural Network accuracy: {tf_accuracy:.3f}")
     
     # Save TensorFlow model - ONLY in models directory
-    tf_model.save("models/asl_model_tf")
+    # Export an XLA-compiled serving signature so the server reuses one fused graph
+    serving_fn = tf.function(
+        lambda features: tf_model(features, training=False),
+        jit_compile=True,
+        input_signature=[tf.TensorSpec([None, X.shape[1]], tf.float32, name="features")]
+    )
+    tf_model.save("models/asl_model_tf", signatures={"serving_default": serving_fn})
     print("💾 Neural Network saved to 'models/asl_model_tf'")
     
+    # Quantized copy for the server - calibrated on the training features
+    export_tflite_int8(tf_model, X_train)
+    
     # Verify no duplicate models in root directory
     if os.path.exists("asl_model_tf"):
         try:
@@ -317,8 +504,7 @@ def train_model():
     print("\n🎉 Training Complete!")
     print("=" * 50)
     print(f"📊 Dataset Summary:")
-    for i, label in enumerate(LABELS):
-        count = sum(1 for val in y if val == i)
+    for label, count in zip(LABELS, class_counts.tolist()):
         print(f"  • {label}: {count} samples")
     print(f"\n🎯 Model Performance:")
     print(f"  • Random Forest: {rf_accuracy:.3f}")
@@ -327,4 +513,13 @@ def train_model():
     print("🔄 Restart your Python server to load new models!")
 
 if __name__ == "__main__":
-    train_model()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Collect webcam samples and train the ASL models")
+    parser.add_argument("--dump-csv", action="store_true",
+                        help="also write the collected samples to asl_data.csv and asl_data.f32")
+    parser.add_argument("--export-tflite", action="store_true",
+                        help="only convert the existing models/asl_model_tf to models/asl_model.tflite")
+    args = parser.parse_args()
+    if args.export_tflite:
+        export_tflite_from_saved_model()
+    else:
+        train_model(dump_csv=args.dump_csv)
\ No newline at end of file